@@ -16,8 +16,12 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
+import asyncio
+import codecs
 import json
 import os
+import selectors
+import shlex
 import subprocess
 from logging import getLogger
 from typing import Any, Dict, List, Optional
@@ -30,6 +34,12 @@ from .utils import _process_command_flags
 
 LOG = getLogger(__name__)
 
+# ANSI wrappers for the command banner, resolved once at import; empty
+# strings when stdout is not a terminal so no escape codes are emitted
+_CYAN = Color.CYAN.value if IS_A_TTY else ""
+_RESET = Color.RESET.value if IS_A_TTY else ""
+_BANNER_PREFIX = "% "
+
 
 def import_from_hf(repo_path_without_tag: str, **kwargs) -> None:
     """
@@ -417,12 +427,108 @@ def version(**kwargs) -> str:
     return version
 
 
+async def apull(repo_path_with_tag: str, **kwargs) -> None:
+    """
+    Asynchronously pulls the specified ModelKit from the remote registry.
+
+    Multiple pulls can be overlapped with asyncio.gather so the kit
+    processes run concurrently instead of serializing on network I/O:
+
+    >>> await asyncio.gather(*[apull(tag) for tag in tags])
+
+    Args:
+        repo_path_with_tag (str): The path to the repository along with the tag to pull.
+        **kwargs: Additional arguments to pass to the command.
+
+    Returns:
+        None
+
+    Raises:
+        subprocess.CalledProcessError: If the command returns a non-zero exit status,
+        The exception contains the return code and the standard error output.
+    """
+    command = ["kit", "pull", repo_path_with_tag]
+
+    command.extend(_process_command_flags(kit_cmd_name="pull", **kwargs))
+    result = await _arun(command=command)
+    LOG.info(result.stdout)
+
+
+async def apush(repo_path_with_tag: str, **kwargs) -> None:
+    """
+    Asynchronously pushes the specified ModelKit to the remote registry.
+
+    Multiple pushes can be overlapped with asyncio.gather so the kit
+    processes run concurrently instead of serializing on network I/O:
+
+    >>> await asyncio.gather(*[apush(tag) for tag in tags])
+
+    Args:
+        repo_path_with_tag (str): The path to the repository along with the tag to be pushed.
+        **kwargs: Additional arguments to pass to the command.
+
+    Returns:
+        None
+
+    Raises:
+        subprocess.CalledProcessError: If the command returns a non-zero exit status,
+        The exception contains the return code and the standard error output.
+    """
+    command = ["kit", "push", repo_path_with_tag]
+
+    command.extend(_process_command_flags(kit_cmd_name="push", **kwargs))
+    result = await _arun(command=command)
+    LOG.info(result.stdout)
+
+
+async def _arun(
+    command: List[Any], input: Optional[str] = None
+) -> subprocess.CompletedProcess:
+    """
+    Asynchronously executes a command in the system shell.
+
+    Args:
+        command (List[Any]): The command to be executed as a list of strings.
+        input (Optional[str]): Optional input to be passed to the command.
+
+    Returns:
+        subprocess.CompletedProcess: The completed process.
+
+    Raises:
+        subprocess.CalledProcessError: If the command returns a non-zero exit status.
+        The exception contains the return code and the standard error output.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=asyncio.subprocess.PIPE if input is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout_bytes, stderr_bytes = await process.communicate(
+        input=input.encode() if input is not None else None
+    )
+    stdout = stdout_bytes.decode()
+    stderr = stderr_bytes.decode()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode, command, output=stdout, stderr=stderr
+        )
+    return subprocess.CompletedProcess(
+        args=command, returncode=process.returncode, stdout=stdout, stderr=stderr
+    )
+
+
 def _run(
     command: List[Any], input: Optional[str] = None, verbose: bool = True, **kwargs
 ) -> subprocess.CompletedProcess:
     """
     Executes a command in the system shell.
 
+    The command's stdout is streamed to the log as it is produced, so
+    long-running commands like pack, push, and pull show progress
+    instead of staying silent until completion. The full output is still
+    collected and returned.
+
     Args:
         command (List[Any]): The command to be executed as a list of strings.
         input (Optional[str]): Optional input to be passed to the command.
@@ -430,24 +536,99 @@ def _run(
         **kwargs: Additional arguments to pass to the command.
 
     Returns:
-        None
+        subprocess.CompletedProcess: The completed process.
 
     Raises:
         subprocess.CalledProcessError: If the command returns a non-zero exit status.
         The exception contains the return code and the standard error output.
     """
     if verbose:
-        output = "% " + " ".join(command)
-        if IS_A_TTY:
-            output = f"{Color.CYAN.value}{output}{Color.RESET.value}"
-        LOG.info(output, flush=True)
+        # shlex.quote keeps arguments containing spaces unambiguous;
+        # _CYAN/_RESET are empty strings off-TTY, so redirected runs
+        # still get an uncolored record of the invoked command
+        LOG.info(f"{_CYAN}{_BANNER_PREFIX}{' '.join(map(shlex.quote, command))}{_RESET}")
 
-    # Because check=True is used, any non-zero exit status will raise a CalledProcessError.
-    return subprocess.run(
+    process = subprocess.Popen(
         command,
-        input=input,
-        text=True,
-        check=True,
+        stdin=subprocess.PIPE if input is not None else None,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    )
+    if input is not None or os.name != "posix":
+        # writing stdin while draining both pipes needs communicate()
+        stdout, stderr = process.communicate(input=input)
+    else:
+        stdout, stderr = _stream_output(process)
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode, command, output=stdout, stderr=stderr
+        )
+    return subprocess.CompletedProcess(
+        args=command, returncode=process.returncode, stdout=stdout, stderr=stderr
     )
+
+
+def _stream_output(process: subprocess.Popen) -> tuple[str, str]:
+    """
+    Drains a process's stdout and stderr, logging stdout line by line
+    as it arrives.
+
+    Reads the raw file descriptors with os.read rather than the buffered
+    text wrappers: readline() on a wrapper can block on a partial line
+    while the child fills the other pipe, and complete lines left in the
+    wrapper's buffer would not be logged until the next select() wakeup.
+
+    Args:
+        process (subprocess.Popen): The running process to drain.
+
+    Returns:
+        tuple[str, str]: The collected stdout and stderr.
+    """
+    selector = selectors.DefaultSelector()
+    names = {
+        process.stdout.fileno(): "stdout",
+        process.stderr.fileno(): "stderr",
+    }
+    for fd in names:
+        os.set_blocking(fd, False)
+        selector.register(fd, selectors.EVENT_READ)
+    # chunks may split a multibyte character, so decode incrementally
+    decoders = {
+        name: codecs.getincrementaldecoder("utf-8")(errors="replace")
+        for name in names.values()
+    }
+    collected: Dict[str, List[str]] = {"stdout": [], "stderr": []}
+    pending_line = ""
+    while selector.get_map():
+        for key, _ in selector.select():
+            chunk = os.read(key.fd, 32768)
+            if not chunk:
+                selector.unregister(key.fd)
+                continue
+            name = names[key.fd]
+            text = decoders[name].decode(chunk)
+            collected[name].append(text)
+            if name == "stdout":
+                # log every complete line in the chunk; keep any
+                # trailing partial line for the next read
+                pending_line += text
+                *lines, pending_line = pending_line.split("\n")
+                for line in lines:
+                    LOG.info(line)
+    for name, decoder in decoders.items():
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            collected[name].append(tail)
+            if name == "stdout":
+                pending_line += tail
+    if pending_line:
+        LOG.info(pending_line)
+    # both pipes hit EOF above; close the wrappers (as communicate()
+    # would) so the fds are released now rather than at GC
+    process.stdout.close()
+    process.stderr.close()
+    process.wait()
+    return "".join(collected["stdout"]), "".join(collected["stderr"])
@@ -16,7 +16,8 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 
 def _process_flag(
@@ -327,6 +328,45 @@ def _process_command_flags(kit_cmd_name: str, **kwargs) -> List[str]:
     """
     Processes the command-specific and global flags for the KitOps CLI.
 
+    Repeated invocations with the same flags (e.g. batch pushes or pulls
+    over many tags) reuse a cached result instead of re-parsing the
+    kwargs each time.
+
+    Args:
+        **kwargs: The command-specific flags to be processed.
+
+    Returns:
+        List[str]: The processed command-specific flags.
+    """
+    try:
+        return list(_cached_command_flags(kit_cmd_name, tuple(sorted(kwargs.items()))))
+    except TypeError:
+        # unhashable flag values cannot be cached; build the flags directly
+        return _build_command_flags(kit_cmd_name, **kwargs)
+
+
+# bounded: flag values are caller-supplied (tags, paths, tokens), so an
+# unbounded cache would grow with every distinct invocation and pin
+# secrets for the process lifetime
+@lru_cache(maxsize=128)
+def _cached_command_flags(kit_cmd_name: str, kwargs_items: Tuple) -> Tuple[str, ...]:
+    """
+    Caches the processed flags for a (command, flags) combination.
+
+    Args:
+        kit_cmd_name (str): The KitOps CLI command name.
+        kwargs_items (Tuple): The flags as a sorted tuple of (key, value) pairs.
+
+    Returns:
+        Tuple[str, ...]: The processed flags.
+    """
+    return tuple(_build_command_flags(kit_cmd_name, **dict(kwargs_items)))
+
+
+def _build_command_flags(kit_cmd_name: str, **kwargs) -> List[str]:
+    """
+    Builds the command-specific and global flags for the KitOps CLI.
+
     Args:
         **kwargs: The command-specific flags to be processed.
 
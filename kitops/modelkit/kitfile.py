@@ -18,12 +18,17 @@
 Define the Kitfile class to manage KitOps ModelKits and Kitfiles.
 """
 
-import copy
+import json
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, ClassVar, Dict, List
 from warnings import warn
 
-import yaml
+try:
+    # optional C-speed JSON encoder, used by save(format="json")
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 from .utils import IS_A_TTY, Color, clean_empty_items, validate_dict
 from .validators.code_validator import CodeValidator
@@ -33,6 +38,68 @@ from .validators.manifest_version_validator import ManifestVersionValidator
 from .validators.model_validator import ModelValidator
 from .validators.package_validator import PackageValidator
 
+# Top-level keys a Kitfile may contain, frozen so the subset check in
+# load() hits the C fast path, with the error text precomputed in a
+# deterministic (sorted) order.
+_KITFILE_ALLOWED_KEYS = frozenset({
+    "manifestVersion",
+    "package",
+    "code",
+    "datasets",
+    "docs",
+    "model",
+})
+_KITFILE_ALLOWED_KEYS_STR = ", ".join(sorted(_KITFILE_ALLOWED_KEYS))
+
+# The section validators are stateless once constructed, so build them a
+# single time at import and share them across every Kitfile instance.
+_MANIFEST_VERSION_VALIDATOR = ManifestVersionValidator(section="manifestVersion", allowed_keys=frozenset())
+_PACKAGE_VALIDATOR = PackageValidator(
+    section="package",
+    allowed_keys=frozenset({"name", "version", "description", "authors"}),
+)
+_CODE_VALIDATOR = CodeValidator(section="code", allowed_keys=frozenset({"path", "description", "license"}))
+_DATASETS_VALIDATOR = DatasetsValidator(
+    section="datasets", allowed_keys=frozenset({"name", "path", "description", "license"})
+)
+_DOCS_VALIDATOR = DocsValidator(section="docs", allowed_keys=frozenset({"path", "description"}))
+_MODEL_VALIDATOR = ModelValidator(
+    section="model",
+    allowed_keys=frozenset({
+        "name",
+        "path",
+        "framework",
+        "version",
+        "description",
+        "license",
+        "parts",
+        "parameters",
+    }),
+)
+
+
+@cache
+def _yaml_backend():
+    """
+    Import PyYAML on first use and resolve the fastest safe loader/dumper.
+
+    Deferring the import keeps PyYAML's bytecode off the startup path for
+    flows that never touch a Kitfile (e.g. plain kit CLI wrappers).
+
+    Returns:
+        tuple: The yaml module, loader class, and dumper class.
+    """
+    import yaml  # noqa: PLC0415
+
+    try:
+        # libyaml-backed loader/dumper; same safe semantics, C speed
+        from yaml import CSafeDumper as dumper  # noqa: PLC0415
+        from yaml import CSafeLoader as loader  # noqa: PLC0415
+    except ImportError:
+        from yaml import SafeDumper as dumper  # noqa: PLC0415
+        from yaml import SafeLoader as loader  # noqa: PLC0415
+    return yaml, loader, dumper
+
 
 class Kitfile:
     """
@@ -42,6 +109,10 @@ class Kitfile:
         path (str): Path to the Kitfile.
     """
 
+    # top-level keys shared by every instance; kept on the class so no
+    # per-instance copy or binding is made
+    _kitfile_allowed_keys: ClassVar[frozenset] = _KITFILE_ALLOWED_KEYS
+
     def __init__(self, path: str | None = None) -> None:
         """
         Initialize the Kitfile from a path to an existing Kitfile, or
@@ -105,91 +176,124 @@ class Kitfile:
             Kitfile (Kitfile): Kitfile object.
         """
         self._data: Dict = {}
-        self._kitfile_allowed_keys: Set[str] = {
-            "manifestVersion",
-            "package",
-            "code",
-            "datasets",
-            "docs",
-            "model",
-        }
+        # cached YAML serializations keyed by suppress_empty_values;
+        # invalidated whenever a section is assigned and disabled for
+        # good once a getter hands out a reference to a mutable section
+        self._yaml_cache: Dict[bool, str] = {}
+        self._dirty: bool = True
+        self._sections_exposed: bool = False
 
         # initialize the kitfile section validators
         self._initialize_kitfile_section_validators()
 
-        # initialize an empty kitfile object
-        self.manifestVersion = ""
-        self.package = {"name": "", "version": "", "description": "", "authors": []}
-        self.code = []
-        self.datasets = []
-        self.docs = []
-        self.model = {
-            "name": "",
-            "path": "",
-            "description": "",
-            "framework": "",
-            "license": "",
-            "version": "",
-            "parts": [],
-            "parameters": "",
-        }
+        # initialize an empty kitfile object; the default sections are
+        # constants known to be valid, so store them directly instead of
+        # running each one through its section validator
+        self._data.update(
+            {
+                "manifestVersion": "",
+                "package": {"name": "", "version": "", "description": "", "authors": []},
+                "code": [],
+                "datasets": [],
+                "docs": [],
+                "model": {
+                    "name": "",
+                    "path": "",
+                    "description": "",
+                    "framework": "",
+                    "license": "",
+                    "version": "",
+                    "parts": [],
+                    "parameters": "",
+                },
+            }
+        )
 
         if path:
             self.load(path)
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Kitfile":
+        """
+        Create a Kitfile from already-validated data, skipping the
+        section validators.
+
+        Only use this for data produced by trusted tooling (e.g. a dict
+        round-tripped through this package, or a cached copy of a
+        previously validated Kitfile); the values are stored as-is and
+        bypass validation entirely.
+
+        Args:
+            data (Dict[str, Any]): Kitfile sections keyed by section name.
+
+        Returns:
+            Kitfile (Kitfile): Kitfile object.
+        """
+        kitfile = cls()
+        kitfile._validate_and_set_attributes(data, validate=False)
+        return kitfile
+
     def _initialize_kitfile_section_validators(self) -> None:
         """
-        Initialize validators for Kitfile sections.
+        Bind the shared validators for Kitfile sections.
         """
-        self._manifestVersion_validator = ManifestVersionValidator(section="manifestVersion", allowed_keys=set())
-        self._package_validator = PackageValidator(
-            section="package",
-            allowed_keys={"name", "version", "description", "authors"},
-        )
-        self._code_validator = CodeValidator(section="code", allowed_keys={"path", "description", "license"})
-        self._datasets_validator = DatasetsValidator(
-            section="datasets", allowed_keys={"name", "path", "description", "license"}
-        )
-        self._docs_validator = DocsValidator(section="docs", allowed_keys={"path", "description"})
-        self._model_validator = ModelValidator(
-            section="model",
-            allowed_keys={
-                "name",
-                "path",
-                "framework",
-                "version",
-                "description",
-                "license",
-                "parts",
-                "parameters",
-            },
-        )
+        self._manifestVersion_validator = _MANIFEST_VERSION_VALIDATOR
+        self._package_validator = _PACKAGE_VALIDATOR
+        self._code_validator = _CODE_VALIDATOR
+        self._datasets_validator = _DATASETS_VALIDATOR
+        self._docs_validator = _DOCS_VALIDATOR
+        self._model_validator = _MODEL_VALIDATOR
 
-    def _validate_and_set_attributes(self, data: Dict[str, Any]) -> None:
+    def _validate_and_set_attributes(self, data: Dict[str, Any], validate: bool = True) -> None:
         """
         Validate and set attributes from the provided data.
 
         Args:
             data (Dict[str, Any]): Data to validate and set.
-        """
+            validate (bool): Whether to run the section validators on
+                each value. When False, values are stored as-is; only
+                use this for data from a trusted source. Defaults to True.
+        """
+        if not validate:
+            self._data.update(data)
+            self._mark_modified()
+            return
         for key, value in data.items():
             self.__setattr__(key, value)
 
-    def load(self, path):
+    def _mark_modified(self) -> None:
+        """
+        Invalidate any cached YAML serialization after a section change.
+        """
+        self._dirty = True
+        self._yaml_cache.clear()
+
+    def load(self, path, validate: bool = True):
         """
         Load Kitfile data from a yaml-formatted file and set the
         corresponding attributes.
 
         Args:
             path (str): Path to the Kitfile.
+            validate (bool): Whether to run the section validators on the
+                loaded data. Skipping validation is faster, but should only
+                be used for Kitfiles produced by trusted tooling (e.g.
+                files this package wrote itself). Defaults to True.
         """
-        kitfile_path = Path(path)
-        if not kitfile_path.exists():
-            raise ValueError(f"Path '{kitfile_path}' does not exist.")
+        # opening the file directly both checks existence and reads it,
+        # saving a Path construction and a separate stat() call
+        try:
+            with open(path, "rb") as kitfile_file:
+                data_bytes = kitfile_file.read()
+        except FileNotFoundError as e:
+            raise ValueError(f"Path '{path}' does not exist.") from e
 
         # try to load the kitfile
+        yaml, loader, _ = _yaml_backend()
         try:
-            data = yaml.safe_load(kitfile_path.read_text(encoding="utf-8"))
+            # feed raw bytes to the loader: libyaml consumes UTF-8
+            # natively, skipping Python's text-mode decode pass
+            data = yaml.load(data_bytes, Loader=loader)
 
         except yaml.YAMLError as e:
             if mark := getattr(e, "problem_mark", None):
@@ -203,10 +307,10 @@ class Kitfile:
             validate_dict(value=data, allowed_keys=self._kitfile_allowed_keys)
         except ValueError as e:
             raise ValueError(
-                f"Kitfile must be a dictionary with allowed keys: {', '.join(self._kitfile_allowed_keys)}"
+                f"Kitfile must be a dictionary with allowed keys: {_KITFILE_ALLOWED_KEYS_STR}"
             ) from e
         # kitfile has been successfully loaded into data
-        self._validate_and_set_attributes(data)
+        self._validate_and_set_attributes(data, validate=validate)
 
     @property
     def manifestVersion(self) -> str:
@@ -228,6 +332,7 @@ class Kitfile:
         """
         self._manifestVersion_validator.validate(data=value)
         self._data["manifestVersion"] = value
+        self._mark_modified()
 
     @property
     def package(self) -> Dict[str, Any]:
@@ -237,6 +342,10 @@ class Kitfile:
         Returns:
             Dict[str, Any]: Package information.
         """
+        # the returned dict is live and the caller may keep the
+        # reference and mutate it at any later point, so caching is
+        # permanently disabled once a mutable section escapes
+        self._sections_exposed = True
         return self._data["package"]
 
     @package.setter
@@ -249,6 +358,7 @@ class Kitfile:
         """
         self._package_validator.validate(data=value)
         self._data["package"] = value
+        self._mark_modified()
 
     @property
     def code(self) -> List[Dict[str, Any]]:
@@ -258,6 +368,7 @@ class Kitfile:
         Returns:
             List[Dict[str, Any]]: Code section.
         """
+        self._sections_exposed = True
         return self._data["code"]
 
     @code.setter
@@ -270,6 +381,7 @@ class Kitfile:
         """
         self._code_validator.validate(data=value)
         self._data["code"] = value
+        self._mark_modified()
 
     @property
     def datasets(self) -> List[Dict[str, Any]]:
@@ -279,6 +391,7 @@ class Kitfile:
         Returns:
             List[Dict[str, Any]]: Datasets section.
         """
+        self._sections_exposed = True
         return self._data["datasets"]
 
     @datasets.setter
@@ -291,6 +404,7 @@ class Kitfile:
         """
         self._datasets_validator.validate(data=value)
         self._data["datasets"] = value
+        self._mark_modified()
 
     @property
     def docs(self) -> List[Dict[str, Any]]:
@@ -300,6 +414,7 @@ class Kitfile:
         Returns:
             List[Dict[str, Any]]: Docs section.
         """
+        self._sections_exposed = True
         return self._data["docs"]
 
     @docs.setter
@@ -312,6 +427,7 @@ class Kitfile:
         """
         self._docs_validator.validate(data=value)
         self._data["docs"] = value
+        self._mark_modified()
 
     @property
     def model(self) -> Dict[str, Any]:
@@ -321,6 +437,7 @@ class Kitfile:
         Returns:
             Dict[str, Any]: Model section.
         """
+        self._sections_exposed = True
         return self._data["model"]
 
     @model.setter
@@ -333,23 +450,40 @@ class Kitfile:
         """
         self._model_validator.validate(data=value)
         self._data["model"] = value
+        self._mark_modified()
 
     def to_yaml(self, suppress_empty_values: bool = True) -> str:
         """
         Serialize the Kitfile to YAML format.
 
+        The serialized string is cached and reused until a section is
+        assigned again, so repeated calls (e.g. print() followed by
+        save()) only serialize once. Once a mutable section has been
+        read, caching is disabled for this instance: the getters return
+        live references, so a caller could mutate a section at any
+        later point without this object noticing.
+
         Args:
             suppress_empty_values (bool, optional): Whether to suppress
                 empty values. Defaults to True.
         Returns:
             str: YAML representation of the Kitfile.
         """
+        if not self._dirty and not self._sections_exposed and suppress_empty_values in self._yaml_cache:
+            return self._yaml_cache[suppress_empty_values]
+
         dict_to_print: Dict = self._data
         if suppress_empty_values:
-            dict_to_print = copy.deepcopy(self._data)
-            dict_to_print = clean_empty_items(dict_to_print)
+            # clean_empty_items() builds new containers as it walks the
+            # tree, so no defensive deepcopy is needed first
+            dict_to_print = clean_empty_items(self._data)
 
-        return yaml.safe_dump(data=dict_to_print, sort_keys=False, default_flow_style=False)
+        yaml, _, dumper = _yaml_backend()
+        output = yaml.dump(data=dict_to_print, Dumper=dumper, sort_keys=False, default_flow_style=False)
+        if not self._sections_exposed:
+            self._yaml_cache[suppress_empty_values] = output
+            self._dirty = False
+        return output
 
     def print(self) -> None:
         """
@@ -371,7 +505,7 @@ class Kitfile:
             output = f"{Color.GREEN.value}{output}{Color.RESET.value}"
         print(output)
 
-    def save(self, path: str = "Kitfile", print: bool = True) -> None:
+    def save(self, path: str = "Kitfile", print: bool = True, format: str = "yaml") -> None:
         """
         Save the Kitfile to a file.
 
@@ -379,6 +513,10 @@ class Kitfile:
             path (str): Path to save the Kitfile. Defaults to "Kitfile".
             print (bool): If True, print the Kitfile to the console.
                 Defaults to True.
+            format (str): Output format, either "yaml" or "json".
+                Defaults to "yaml". Since valid JSON is valid YAML, the
+                "json" output is still a readable Kitfile but serializes
+                much faster for machine-consumed pipelines.
 
         Returns:
             None
@@ -387,7 +525,16 @@ class Kitfile:
             >>> kitfile = Kitfile()
             >>> kitfile.save("path/to/Kitfile")
         """
-        Path(path).write_text(self.to_yaml(), encoding="utf-8")
+        if format == "json":
+            data = clean_empty_items(self._data)
+            if _orjson is not None:
+                Path(path).write_bytes(_orjson.dumps(data, option=_orjson.OPT_INDENT_2))
+            else:
+                Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        elif format == "yaml":
+            Path(path).write_text(self.to_yaml(), encoding="utf-8")
+        else:
+            raise ValueError(f"Unsupported format: '{format}'. Expected 'yaml' or 'json'.")
 
         if print:
             warn(
@@ -58,8 +58,10 @@ def validate_dict(value: Dict[str, Any], allowed_keys: Set[str]):
     """
     if not isinstance(value, dict):
         raise ValueError(f"Expected a dictionary but got {type(value).__name__}")
-    unallowed_keys = set(value.keys()) - allowed_keys
-    if len(unallowed_keys) > 0:
+    # the subset check on the keys view stays in C; only build the
+    # difference set when there is something to report
+    if not value.keys() <= allowed_keys:
+        unallowed_keys = value.keys() - allowed_keys
         raise ValueError("Found unallowed key(s): " + f"{', '.join(unallowed_keys)}")
 
 
@@ -80,15 +82,26 @@ def clean_empty_items(d: Any) -> Any:
     Returns:
         Any: Cleaned dictionary or list.
     """
+    # only containers need the recursive walk; scalar leaves are kept or
+    # dropped in place without another call per value
     if isinstance(d, dict):
-        return {
-            k: clean_empty_items(v)
-            for k, v in d.items()
-            if v is not None and (v.strip() != "" if isinstance(v, str) else True)
-        }
+        cleaned = {}
+        for k, v in d.items():
+            if isinstance(v, (dict, list)):
+                cleaned[k] = clean_empty_items(v)
+            elif isinstance(v, str):
+                if v.strip() != "":
+                    cleaned[k] = v
+            elif v is not None:
+                cleaned[k] = v or None
+        return cleaned
 
     elif isinstance(d, list):
-        return [clean_empty_items(item) for item in d if item]
+        return [
+            clean_empty_items(item) if isinstance(item, (dict, list)) else item
+            for item in d
+            if item
+        ]
 
     if d:
         return d
@@ -16,22 +16,31 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from typing import Any, Set
+from typing import Any
 
 from .dict_validator import DictValidator
 
 
+def _raise_not_list(section: str, data: Any):
+    """
+    Raises the list type error; kept out of validate() so the happy
+    path stays a single type check.
+    """
+    raise TypeError(
+        f"Problem processing '{section}'."
+        + f"Expected a list but got {type(data).__name__}"
+    )
+
+
 class DictListValidator(DictValidator):
-    def __init__(self, section: str, allowed_keys: Set[str]):
-        super().__init__(section, allowed_keys)
+    __slots__ = ()
 
     def validate(self, data: Any):
         if not isinstance(data, list):
-            raise TypeError(
-                f"Problem processing '{self.section}'."
-                + f"Expected a list but got {type(data).__name__}"
-            )
+            _raise_not_list(self.section, data)
 
-        # process the list of items
+        # process the list of items; bind the parent's validate once so
+        # each iteration skips the super() descriptor lookup
+        validate_item = super().validate
         for item in data:
-            super().validate(item)
+            validate_item(item)
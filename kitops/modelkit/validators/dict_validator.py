@@ -22,8 +22,7 @@ from .string_validator import StringValidator
 
 
 class DictValidator(StringValidator):
-    def __init__(self, section: str, allowed_keys: Set[str]):
-        super().__init__(section, allowed_keys)
+    __slots__ = ()
 
     def validate(self, data: Any):
         if not isinstance(data, dict):
@@ -31,9 +30,11 @@ class DictValidator(StringValidator):
                 f"Problem with '{self.section}' section. "
                 + f"Expected a dictionary but got {type(data).__name__}"
             )
-        data_keys = set(data.keys())
-        unallowed_keys = data_keys.difference(self.allowed_keys)
-        if len(unallowed_keys) > 0:
+        data_keys = data.keys()
+        # subset check on the keys view runs in C; only compute the
+        # difference when the check fails
+        if not data_keys <= self.allowed_keys:
+            unallowed_keys = data_keys - self.allowed_keys
             raise ValueError(
                 f"Problem with '{self.section}' section. "
                 + "Found unallowed key(s): "
@@ -16,14 +16,8 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from typing import Any, Set
-
 from .dict_list_validator import DictListValidator
 
 
 class DocsValidator(DictListValidator):
-    def __init__(self, section: str, allowed_keys: Set[str]):
-        super().__init__(section, allowed_keys)
-
-    def validate(self, data: Any):
-        super().validate(data)
+    __slots__ = ()
@@ -24,24 +24,19 @@ from .string_validator import StringValidator
 
 
 class ModelPartsValidator(DictListValidator):
-    def __init__(self, section: str, allowed_keys: Set[str]):
-        super().__init__(section, allowed_keys)
-
-    def validate(self, data: Any):
-        super().validate(data)
+    __slots__ = ()
 
 
 class ModelValidator(DictValidator):
+    __slots__ = ("_parts_validator",)
+
     def __init__(self, section: str, allowed_keys: Set[str]):
         super().__init__(section, allowed_keys)
 
         self._parts_validator = ModelPartsValidator(
-            section="parts", allowed_keys={"name", "path", "type"}
+            section="parts", allowed_keys=frozenset({"name", "path", "type"})
         )
 
-    def validate(self, data: Any):
-        super().validate(data)
-
     def validate_values(self, data: Any, keys=Set[str]):
         # the keys in data are allowed, so process their values
         for key in keys:
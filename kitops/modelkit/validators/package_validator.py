@@ -16,18 +16,12 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from typing import Any, Set
-
 from .dict_validator import DictValidator
 from .string_validator import StringValidator
 
 
 class PackageValidator(DictValidator):
-    def __init__(self, section: str, allowed_keys: Set[str]):
-        super().__init__(section, allowed_keys)
-
-    def validate(self, data: Any):
-        super().validate(data)
+    __slots__ = ()
 
     # Overrides DictValidator.validate_values
     def validate_values(self, data, keys):
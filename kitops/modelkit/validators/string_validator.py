@@ -20,6 +20,10 @@ from typing import Any, Set
 
 
 class StringValidator:
+    # slotted layout: validators are tiny shared singletons and need no
+    # per-instance __dict__
+    __slots__ = ("_section", "_allowed_keys")
+
     def __init__(self, section: str, allowed_keys: Set[str]):
         self.section = section
         self.allowed_keys = allowed_keys
@@ -8,3 +8,39 @@ class TestKitfileCreation:
         kitfile_path = fixtures["Kitfile_full"]
         kitfile = Kitfile(path=str(kitfile_path))
         assert kitfile is not None
+
+    def test_to_yaml_cache_invalidated_on_assignment(self, fixtures: dict[str, Path]):
+        kitfile = Kitfile(path=str(fixtures["Kitfile_full"]))
+        first = kitfile.to_yaml()
+        assert kitfile.to_yaml() is first
+        kitfile.manifestVersion = "99.0"
+        assert "99.0" in kitfile.to_yaml()
+
+    def test_to_yaml_reflects_in_place_mutation(self, fixtures: dict[str, Path]):
+        kitfile = Kitfile(path=str(fixtures["Kitfile_full"]))
+        kitfile.to_yaml()
+        kitfile.package["name"] = "RENAMED"
+        assert "RENAMED" in kitfile.to_yaml()
+
+    def test_to_yaml_reflects_mutation_of_retained_reference(self, fixtures: dict[str, Path]):
+        kitfile = Kitfile(path=str(fixtures["Kitfile_full"]))
+        model = kitfile.model
+        # serialize after the reference escaped, then mutate it
+        kitfile.to_yaml()
+        model["version"] = "2.0"
+        assert "2.0" in kitfile.to_yaml()
+
+    def test_save_json_round_trips_as_kitfile(self, fixtures: dict[str, Path], tmp_path: Path):
+        kitfile = Kitfile(path=str(fixtures["Kitfile_full"]))
+        saved_path = tmp_path / "Kitfile"
+        kitfile.save(str(saved_path), print=False, format="json")
+        # JSON is valid YAML, so the saved file loads like any Kitfile
+        reloaded = Kitfile(path=str(saved_path))
+        assert reloaded.manifestVersion == kitfile.manifestVersion
+        assert reloaded.package == kitfile.package
+
+    def test_from_trusted_skips_validation(self, fixtures: dict[str, Path]):
+        loaded = Kitfile(path=str(fixtures["Kitfile_full"]))
+        kitfile = Kitfile.from_trusted(loaded._data)
+        assert kitfile.manifestVersion == loaded.manifestVersion
+        assert kitfile.to_yaml() == loaded.to_yaml()